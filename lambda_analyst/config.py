@@ -116,14 +116,10 @@ def get_agent_config():
         dict: Configuration for creating Agent instances
     """
     import os
-    from strands.models import BedrockModel
     
     # Set AWS region environment variable for Bedrock
     os.environ.setdefault('AWS_REGION', AWS_REGION)
     
-    # Create Bedrock model instance
-    model = BedrockModel(region_name=AWS_REGION)
-    
     return {
         "model": MODEL_STRING  # Pass model string directly to Agent
     }
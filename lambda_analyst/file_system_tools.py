@@ -88,7 +88,7 @@ def list_directory(path: str = ".", show_hidden: bool = False, detailed: bool =
                 return f"Directory is empty: {path}"
             
             # Add context about what directory we're listing
-            header = f"Contents of {path}:\n" + "=" * (len(path) + 12) + "\n"
+            header = f"Contents of {path}:\n{'=' * (len(path) + 12)}\n"
             return header + output
         else:
             return f"Error listing directory {path}: {result.stderr}"
@@ -119,10 +119,11 @@ def peek_file(file_path: str, lines: int = 20, from_end: bool = False) -> str:
         safe_path = _validate_path(file_path)
         
         # Check if file exists and is readable
-        if not Path(safe_path).exists():
-            return f"File does not exist: {file_path}"
-        
-        if not Path(safe_path).is_file():
+        # is_file() covers the common case with one stat; exists() only runs on failure
+        target = Path(safe_path)
+        if not target.is_file():
+            if not target.exists():
+                return f"File does not exist: {file_path}"
             return f"Path is not a file: {file_path}"
         
         # Use head or tail based on from_end parameter
@@ -142,7 +143,7 @@ def peek_file(file_path: str, lines: int = 20, from_end: bool = False) -> str:
             
             # Add context about what we're showing
             direction = "last" if from_end else "first"
-            header = f"{direction.title()} {lines} lines of {file_path}:\n" + "=" * 50 + "\n"
+            header = f"{direction.title()} {lines} lines of {file_path}:\n{'=' * 50}\n"
             
             if not output:
                 return f"File appears to be empty: {file_path}"
@@ -175,10 +176,11 @@ def change_directory(path: str) -> str:
         safe_path = _validate_path(path)
         
         # Check if directory exists
-        if not Path(safe_path).exists():
-            return f"Directory does not exist: {path}"
-        
-        if not Path(safe_path).is_dir():
+        # is_dir() covers the common case with one stat; exists() only runs on failure
+        target = Path(safe_path)
+        if not target.is_dir():
+            if not target.exists():
+                return f"Directory does not exist: {path}"
             return f"Path is not a directory: {path}"
         
         # Change directory
@@ -228,11 +230,10 @@ def find_files_by_pattern(pattern: str, path: str = ".", max_results: int = 50)
             if not output:
                 return f"No files found matching pattern '{pattern}' in {path}"
             
-            # Count results and add header
-            file_list = output.split('\n')
-            count = len(file_list)
+            # Count results and add header (output is stripped and non-empty)
+            count = output.count('\n') + 1
             
-            header = f"Found {count} files matching '{pattern}' in {path}:\n" + "=" * 50 + "\n"
+            header = f"Found {count} files matching '{pattern}' in {path}:\n{'=' * 50}\n"
             return header + output
         else:
             return f"Error searching for pattern '{pattern}': {result.stderr}"
@@ -286,13 +287,15 @@ def get_file_info(file_path: str) -> str:
                 timeout=5
             )
             
-            info = f"File information for {file_path}:\n" + "=" * 40 + "\n"
-            info += result.stdout.strip() + "\n\n"
-            
+            info_parts = [
+                f"File information for {file_path}:\n{'=' * 40}\n",
+                result.stdout.strip() + "\n\n"
+            ]
+
             if file_result.returncode == 0:
-                info += "File type: " + file_result.stdout.strip()
-            
-            return info
+                info_parts.append("File type: " + file_result.stdout.strip())
+
+            return ''.join(info_parts)
         else:
             return f"Error getting file info for {file_path}: {result.stderr}"
             
@@ -332,7 +335,7 @@ def explore_project_structure(path: str = ".", max_depth: int = 3) -> str:
         )
         
         if result.returncode == 0:
-            header = f"Project structure for {path} (depth {max_depth}):\n" + "=" * 60 + "\n"
+            header = f"Project structure for {path} (depth {max_depth}):\n{'=' * 60}\n"
             return header + result.stdout.strip()
         else:
             # Fallback to find if tree is not available
@@ -347,7 +350,7 @@ def explore_project_structure(path: str = ".", max_depth: int = 3) -> str:
             )
             
             if find_result.returncode == 0:
-                header = f"Directory structure for {path} (depth {max_depth}):\n" + "=" * 60 + "\n"
+                header = f"Directory structure for {path} (depth {max_depth}):\n{'=' * 60}\n"
                 return header + find_result.stdout.strip()
             else:
                 return f"Error exploring project structure: {find_result.stderr}"
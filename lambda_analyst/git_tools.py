@@ -23,29 +23,54 @@ Example:
 
 from strands import tool
 import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import os
 from typing import Optional
 from pathlib import Path
 
 
+# Different log formats for different analysis needs
+GIT_LOG_FORMATS = {
+    'oneline': 'git log --oneline -{max_entries}',
+    'detailed': 'git log --pretty=format:"%h %ad %s" --date=short -{max_entries}',
+    'stats': 'git log --stat -{max_entries}'
+}
+
+# Patterns for key files that are important for documentation
+KEY_FILE_PATTERNS = [
+    "README*", "readme*",
+    "package.json", "package-lock.json",
+    "requirements.txt", "requirements*.txt", "pyproject.toml", "setup.py",
+    "Dockerfile", "docker-compose*",
+    "Makefile", "makefile",
+    "*.config.js", "*.config.ts", "*.json",
+    "LICENSE", "license*",
+    ".env*", "env*",
+    "yarn.lock", "pnpm-lock.yaml",
+    "go.mod", "Cargo.toml",
+    "pom.xml", "build.gradle"
+]
+
+# find expression matching any key file pattern in a single traversal
+KEY_FILE_NAME_TESTS = " -o ".join(f"-name '{pattern}'" for pattern in KEY_FILE_PATTERNS)
+
 def _validate_repo_path(repo_path: str) -> str:
     """Validate and sanitize repository path to prevent shell injection."""
     try:
         # Convert to Path object and resolve to absolute path
         path = Path(repo_path).resolve()
         
-        # Basic validation - must exist and be a directory
-        if not path.exists():
-            raise ValueError(f"Path does not exist: {repo_path}")
+        # Basic validation - must be an existing directory (is_dir() is False for missing paths)
         if not path.is_dir():
-            raise ValueError(f"Path is not a directory: {repo_path}")
-            
-        # Return absolute path as string
-        return str(path)
-        
-    except Exception:
-        # If validation fails, default to current directory
+            return str(Path.cwd())
+    except (OSError, RuntimeError, TypeError, ValueError):
+        # If the path cannot be resolved or inspected (e.g. permission denied),
+        # default to current directory
         return str(Path.cwd())
+    
+    # Return absolute path as string
+    return str(path)
 
 
 @tool
@@ -68,14 +93,9 @@ def git_log(repo_path: str = ".", max_entries: int = 20, format_type: str = "one
         # Validate and sanitize the repository path
         safe_repo_path = _validate_repo_path(repo_path)
         
-        # Define different log formats for different analysis needs
-        formats = {
-            'oneline': f'git log --oneline -{max_entries}',
-            'detailed': f'git log --pretty=format:"%h %ad %s" --date=short -{max_entries}',
-            'stats': f'git log --stat -{max_entries}'
-        }
-        
-        command = formats.get(format_type, formats['oneline'])
+        # Fill in only the selected log format
+        template = GIT_LOG_FORMATS.get(format_type, GIT_LOG_FORMATS['oneline'])
+        command = template.format(max_entries=max_entries)
         
         result = subprocess.run(
             command,
@@ -199,12 +219,9 @@ def git_recent_files(repo_path: str = ".", since: str = "3 months ago", max_file
         String containing frequently changed files with change counts
     """
     try:
-        # Get files changed since specified time, count occurrences, sort by frequency
-        command = (
-            f"git log --name-only --since='{since}' --pretty=format: | "
-            f"grep -v '^$' | sort | uniq -c | sort -nr | head -{max_files}"
-        )
-        
+        # Get files changed since specified time; counting happens in-process
+        command = f"git log --name-only --since='{since}' --pretty=format:"
+
         result = subprocess.run(
             f"cd {repo_path} && {command}",
             shell=True,
@@ -212,12 +229,18 @@ def git_recent_files(repo_path: str = ".", since: str = "3 months ago", max_file
             text=True,
             timeout=30
         )
-        
+
         if result.returncode == 0:
-            files = result.stdout.strip()
-            if not files:
+            # Count occurrences and sort by frequency (same layout as `uniq -c`);
+            # ties are ordered by path so repeated runs give identical output
+            change_counts = Counter(line for line in result.stdout.splitlines() if line)
+            if not change_counts:
                 return f"No file changes found since {since}"
-            return files
+            ranked_files = sorted(change_counts.items(), key=lambda item: (-item[1], item[0]))
+            return '\n'.join(
+                f"{count:7d} {file_name}"
+                for file_name, count in ranked_files[:max_files]
+            )
         else:
             return f"Error analyzing recent files: {result.stderr}"
             
@@ -289,8 +312,7 @@ def git_repo_stats(repo_path: str = ".") -> str:
             'total_files': 'git ls-files | wc -l'
         }
         
-        stats = {}
-        for stat_name, command in commands.items():
+        def run_stat_command(command):
             result = subprocess.run(
                 f"cd {repo_path} && {command}",
                 shell=True,
@@ -299,10 +321,12 @@ def git_repo_stats(repo_path: str = ".") -> str:
                 timeout=10
             )
             
-            if result.returncode == 0:
-                stats[stat_name] = result.stdout.strip()
-            else:
-                stats[stat_name] = "unknown"
+            return result.stdout.strip() if result.returncode == 0 else "unknown"
+        
+        # The git commands are independent - run them concurrently so the total
+        # wait is the slowest command rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            stats = dict(zip(commands, executor.map(run_stat_command, commands.values())))
         
         # Format the statistics into a readable summary
         summary = f"""Repository Statistics:
@@ -335,40 +359,21 @@ def find_key_files(repo_path: str = ".") -> str:
         String containing list of found key files or message if none found
     """
     try:
-        # Define patterns for key files that are important for documentation
-        key_patterns = [
-            "README*", "readme*",
-            "package.json", "package-lock.json",
-            "requirements.txt", "requirements*.txt", "pyproject.toml", "setup.py",
-            "Dockerfile", "docker-compose*",
-            "Makefile", "makefile",
-            "*.config.js", "*.config.ts", "*.json",
-            "LICENSE", "license*",
-            ".env*", "env*",
-            "yarn.lock", "pnpm-lock.yaml",
-            "go.mod", "Cargo.toml",
-            "pom.xml", "build.gradle"
-        ]
+        result = subprocess.run(
+            f"cd {repo_path} && find . -maxdepth 2 -type f \\( {KEY_FILE_NAME_TESTS} \\)",
+            shell=True,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
         
         found_files = []
-        
-        for pattern in key_patterns:
-            result = subprocess.run(
-                f"cd {repo_path} && find . -maxdepth 2 -name '{pattern}' -type f",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                files = result.stdout.strip().split('\n')
-                found_files.extend([f.strip() for f in files if f.strip()])
+        if result.returncode == 0:
+            found_files = [f.strip() for f in result.stdout.splitlines() if f.strip()]
         
         if found_files:
-            # Remove duplicates and sort
-            unique_files = sorted(list(set(found_files)))
-            return '\n'.join(unique_files)
+            # A single find traversal reports each file once, so only sorting is needed
+            return '\n'.join(sorted(found_files))
         else:
             return "No key configuration or documentation files found"
             
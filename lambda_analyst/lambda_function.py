@@ -5,7 +5,6 @@ import zipfile
 import tempfile
 import shutil
 from datetime import datetime
-from pathlib import Path
 import boto3
 
 # Import Magic Mirror for Strands analysis
@@ -29,22 +28,23 @@ def lambda_handler(event, context):
     # Generate task ID for tracking
     task_id = f"strands_analysis_{int(datetime.utcnow().timestamp())}"
     
+    # Repository info shared by all task events; stays 'unknown' if the event can't be parsed
+    repository_info = {'owner': 'unknown', 'name': 'unknown', 'commit_sha': 'unknown'}
+    
     try:
-        # Parse EventBridge event
+        # Parse EventBridge event once
         event_detail = event.get('detail', {})
         repository = event_detail.get('repository', {})
-        repo_owner = repository.get('owner', 'unknown')
-        repo_name = repository.get('name', 'unknown')
-        commit_sha = repository.get('commit_sha', 'unknown')
+        repository_info = {
+            'owner': repository.get('owner', 'unknown'),
+            'name': repository.get('name', 'unknown'),
+            'commit_sha': repository.get('commit_sha', 'unknown')
+        }
         s3_location = event_detail.get('s3_location', '')
         
         # Send task_started event
         send_task_event('task_started', task_id, {
-            'repository': {
-                'owner': repo_owner,
-                'name': repo_name,
-                'commit_sha': commit_sha
-            },
+            'repository': repository_info,
             's3_location': s3_location,
             'message': 'Strands analysis processing started'
         })
@@ -63,14 +63,8 @@ def lambda_handler(event, context):
         
         # Send task_failed event and stop (no fallback)
         try:
-            event_detail = event.get('detail', {})
-            repository = event_detail.get('repository', {})
             send_task_event('task_failed', task_id, {
-                'repository': {
-                    'owner': repository.get('owner', 'unknown'),
-                    'name': repository.get('name', 'unknown'),
-                    'commit_sha': repository.get('commit_sha', 'unknown')
-                },
+                'repository': repository_info,
                 'error': {
                     'type': type(e).__name__,
                     'message': str(e),
@@ -117,21 +111,25 @@ def process_strands_analysis(event_detail, task_id):
             analysis_key = f"{s3_location}/analysis/README.md"
             upload_analysis_results(analysis_key, analysis_result)
             
-            # Publish analysis_ready event for Deliverer
-            send_analysis_ready_event(s3_location, repo_owner, repo_name)
+            # Publish analysis_ready event for Deliverer and task_completed event in one call
+            eventbridge_client.put_events(
+                Entries=[
+                    build_analysis_ready_entry(s3_location, repo_owner, repo_name),
+                    build_task_event_entry('task_completed', task_id, {
+                        'repository': {
+                            'owner': repo_owner,
+                            'name': repo_name,
+                            'commit_sha': commit_sha
+                        },
+                        's3_location': s3_location,
+                        'analysis_location': f"{s3_location}/analysis/",
+                        'analysis_type': 'strands_magic_mirror',
+                        'message': 'Strands analysis completed successfully'
+                    })
+                ]
+            )
             
-            # Send task_completed event
-            send_task_event('task_completed', task_id, {
-                'repository': {
-                    'owner': repo_owner,
-                    'name': repo_name,
-                    'commit_sha': commit_sha
-                },
-                's3_location': s3_location,
-                'analysis_location': f"{s3_location}/analysis/",
-                'analysis_type': 'strands_magic_mirror',
-                'message': 'Strands analysis completed successfully'
-            })
+            print(f"Sent analysis_ready and task_completed events for task {task_id}")
             
             print(f"✅ Strands analysis completed for repository: {repo_owner}/{repo_name}")
             
@@ -179,14 +177,11 @@ def download_and_extract_workingcopy(s3_location):
         
         # Extract ZIP to temporary directory
         with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-            # Test ZIP integrity
-            zip_ref.testzip()
-            
-            # Extract all files
+            # Extract all files (extraction verifies each member's CRC and raises BadZipFile on corruption)
             zip_ref.extractall(temp_dir)
             
-            # Count extracted files
-            file_count = sum(1 for _ in Path(temp_dir).rglob('*') if _.is_file())
+            # Count extracted files from the archive index - no directory walk needed
+            file_count = sum(1 for info in zip_ref.infolist() if not info.is_dir())
             print(f"Successfully extracted workingcopy with {file_count} files to {temp_dir}")
         
         # Clean up temporary ZIP file
@@ -230,8 +225,8 @@ def upload_analysis_results(analysis_key, content):
         print(f"Error uploading analysis results: {str(e)}")
         raise ValueError(f"Failed to upload analysis results: {str(e)}")
 
-def send_analysis_ready_event(s3_location, repo_owner, repo_name):
-    """Send analysis_ready event for Deliverer"""
+def build_analysis_ready_entry(s3_location, repo_owner, repo_name):
+    """Build analysis_ready event entry for Deliverer"""
     
     event_detail = {
         's3_location': s3_location,
@@ -243,18 +238,14 @@ def send_analysis_ready_event(s3_location, repo_owner, repo_name):
         'message': 'Strands analysis ready for delivery'
     }
     
-    eventbridge_client.put_events(
-        Entries=[{
-            'Source': 'coderipple.system',
-            'DetailType': 'analysis_ready',
-            'Detail': json.dumps(event_detail)
-        }]
-    )
-    
-    print(f"Sent analysis_ready event for {repo_owner}/{repo_name}")
+    return {
+        'Source': 'coderipple.system',
+        'DetailType': 'analysis_ready',
+        'Detail': json.dumps(event_detail)
+    }
 
-def send_task_event(event_type, task_id, details):
-    """Send task logging events following Component Task Logging Standard"""
+def build_task_event_entry(event_type, task_id, details):
+    """Build task logging event entry following Component Task Logging Standard"""
     
     event_detail = {
         'task_id': task_id,
@@ -264,12 +255,17 @@ def send_task_event(event_type, task_id, details):
         **details
     }
     
+    return {
+        'Source': 'coderipple.analyst',
+        'DetailType': event_type,
+        'Detail': json.dumps(event_detail)
+    }
+
+def send_task_event(event_type, task_id, details):
+    """Send task logging events following Component Task Logging Standard"""
+    
     eventbridge_client.put_events(
-        Entries=[{
-            'Source': 'coderipple.analyst',
-            'DetailType': event_type,
-            'Detail': json.dumps(event_detail)
-        }]
+        Entries=[build_task_event_entry(event_type, task_id, details)]
     )
     
     print(f"Sent {event_type} event for task {task_id}")
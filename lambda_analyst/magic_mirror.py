@@ -23,6 +23,8 @@ Usage:
 import logging
 import os
 import sys
+from pathlib import Path
+from subprocess import run
 from strands import Agent
 from strands_tools import file_read, file_write
 
@@ -111,6 +113,32 @@ except ImportError:
     SMART_DETECTION_AVAILABLE = False
     logger.warning("🚫 Smart project detection not available - better_prompts.py not found")
 
+# Map tool names used in PROMPT_TOOL_MAPPING to actual tool functions
+TOOL_MAP = {
+    'execution_time_status': execution_time_status,
+    'quick_time_check': quick_time_check,
+    'git_repo_stats': git_repo_stats,
+    'git_files': git_files,
+    'git_recent_files': git_recent_files,
+    'git_log': git_log,
+    'git_contributors': git_contributors,
+    'git_branch_info': git_branch_info,
+    'find_key_files': find_key_files,
+    'file_read': file_read,
+    'list_directory': list_directory,
+    'peek_file': peek_file,
+    'explore_project_structure': explore_project_structure
+}
+
+# Files whose contents feed smart project type detection
+DETECTION_KEY_FILES = ('package.json', 'requirements.txt', 'manage.py', 'Dockerfile', 'Cargo.toml', 'pom.xml', 'pubspec.yaml')
+
+# Phase announcements and agent chatter stripped from the final documentation
+RESPONSE_ARTIFACT_PREFIXES = (
+    "🔍 PHASE", "🏗️ PHASE", "📈 PHASE", "✨ QUALITY",
+    "Based on", "Let me", "I'll"
+)
+
 
 def create_magic_mirror(quiet: bool = False) -> Agent:
     """Create the Magic Mirror agent with full analytical capabilities.
@@ -315,9 +343,6 @@ def detect_project_type(repo_path: str) -> dict:
     
     try:
         # Get file list from git and file system
-        from pathlib import Path
-        from subprocess import run, PIPE
-        
         repo_path_obj = Path(repo_path)
         
         # Get file list from git if available
@@ -325,21 +350,24 @@ def detect_project_type(repo_path: str) -> dict:
         if result.returncode == 0:
             file_list = result.stdout.strip().split('\n')
         else:
-            # Fallback to file system
-            file_list = [str(f.relative_to(repo_path_obj)) for f in repo_path_obj.rglob('*') if f.is_file()]
+            # Fallback to file system - os.walk gets file names from directory scans,
+            # without building a Path and a stat() call per entry
+            file_list = [
+                os.path.relpath(os.path.join(root, name), repo_path)
+                for root, _, files in os.walk(repo_path)
+                for name in files
+            ]
         
         # Read key files for content analysis
         file_contents = {}
-        key_files = ['package.json', 'requirements.txt', 'manage.py', 'Dockerfile', 'Cargo.toml', 'pom.xml', 'pubspec.yaml']
         
-        for key_file in key_files:
-            file_path = repo_path_obj / key_file
-            if file_path.exists() and file_path.is_file():
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_contents[key_file] = f.read()[:2000]  # Limit content size
-                except:
-                    continue
+        for key_file in DETECTION_KEY_FILES:
+            # open() raises OSError for missing files and directories, so no separate is_file() stat
+            try:
+                with open(repo_path_obj / key_file, 'r', encoding='utf-8') as f:
+                    file_contents[key_file] = f.read(2000)  # Limit content size without reading the whole file
+            except (OSError, UnicodeDecodeError):
+                continue
         
         # Use smart detection
         enhanced_analysis = enhance_coderipple_analysis(file_list, file_contents)
@@ -376,8 +404,6 @@ def analyze_repository(repo_path: str, quiet: bool = False) -> str:
     Raises:
         ValueError: If repo_path is invalid or doesn't exist
     """
-    from pathlib import Path
-    
     # Validate repository path
     repo_path_obj = Path(repo_path)
     if not repo_path_obj.exists():
@@ -394,25 +420,19 @@ def analyze_repository(repo_path: str, quiet: bool = False) -> str:
     
     # Detect project type for specialized analysis
     project_analysis = detect_project_type(repo_path)
+    project_type = project_analysis['project_type']
     
-    # Create the Magic Mirror (potentially with specialized prompt)
-    if project_analysis['project_type'] != 'generic' and project_analysis['specialized_prompt']:
-        logger.info(f"🎯 Using specialized {project_analysis['project_type']} analysis")
-        # Create mirror with specialized prompt
-        mirror = create_magic_mirror(quiet=quiet)
-        # We'll update the system prompt for this analysis
-        specialized_query = True
-    else:
-        logger.info("🔧 Using comprehensive generic analysis")
-        mirror = create_magic_mirror(quiet=quiet)
-        specialized_query = False
+    # Create the Magic Mirror - the specialized prompt goes into the query, not the agent
+    mirror = create_magic_mirror(quiet=quiet)
     
     # Ask the Magic Mirror to reveal the truth about this repository
-    if specialized_query and project_analysis['specialized_prompt']:
+    if project_type != 'generic' and project_analysis['specialized_prompt']:
+        logger.info(f"🎯 Using specialized {project_type} analysis")
         # Use specialized prompt for detected framework
-        base_query = f"""Mirror, mirror, reveal the truth about this {project_analysis['project_type']} codebase!
+        project_title = project_type.title()
+        base_query = f"""Mirror, mirror, reveal the truth about this {project_type} codebase!
 
-🎯 SPECIALIZED ANALYSIS DETECTED: {project_analysis['project_type'].upper()}
+🎯 SPECIALIZED ANALYSIS DETECTED: {project_type.upper()}
 🌟 Focus Area: {project_analysis['wow_factor']}
 
 {project_analysis['specialized_prompt']}
@@ -422,14 +442,15 @@ def analyze_repository(repo_path: str, quiet: bool = False) -> str:
 Repository location: {repo_path}
 
 **Analysis Process:**
-1. Start with "🔍 PHASE 1: {project_analysis['project_type'].title()} Getting Started Analysis" 
-2. Then "🏗️ PHASE 2: {project_analysis['project_type'].title()} Architecture Analysis"
+1. Start with "🔍 PHASE 1: {project_title} Getting Started Analysis" 
+2. Then "🏗️ PHASE 2: {project_title} Architecture Analysis"
 3. Then "📈 PHASE 3: Project Evolution Analysis"
-4. Apply quality improvements focusing on {project_analysis['project_type']} best practices
+4. Apply quality improvements focusing on {project_type} best practices
 
-Use your tools strategically and highlight {project_analysis['project_type']}-specific features and patterns."""
+Use your tools strategically and highlight {project_type}-specific features and patterns."""
         query = base_query
     else:
+        logger.info("🔧 Using comprehensive generic analysis")
         # Use generic comprehensive analysis
         query = f"""Mirror, mirror, reveal the truth about this codebase!
 
@@ -460,52 +481,43 @@ Always deliver comprehensive documentation with all required sections."""
     
     logger.info("🏁 Magic Mirror: Raw analysis complete, now cleaning response...")
     
+    # Without any markdown header there is no documentation to keep
+    if '#' not in result:
+        logger.warning("🚫 Magic Mirror response contains no markdown headers")
+        return ''
+    
     # Clean up the response - remove leading/trailing whitespace and unwanted prefixes
     cleaned_result = result.strip()
-    
-    # Remove markdown code block wrapper if present
-    if cleaned_result.startswith('```markdown'):
-        lines = cleaned_result.split('\n')
-        # Remove first line (```markdown) and last line if it's closing backticks
-        if lines and lines[0].strip() == '```markdown':
-            lines = lines[1:]
-        if lines and lines[-1].strip() == '```':
-            lines = lines[:-1]
-        cleaned_result = '\n'.join(lines)
-    
-    # Remove everything before the first markdown header and clean artifacts
     lines = cleaned_result.split('\n')
-    cleaned_lines = []
-    found_first_header = False
-    
-    for i, line in enumerate(lines):
-        stripped_line = line.strip()
-        
-        # Look for the first markdown header to start the real documentation
-        if not found_first_header:
-            if stripped_line.startswith('#'):
-                found_first_header = True
-            else:
-                continue  # Skip everything before the first header
+
+    # Remove markdown code block wrapper if present. The opening ```markdown line
+    # is dropped by the header scan below, so only the closing fence needs handling.
+    if cleaned_result.startswith('```markdown') and len(lines) > 1 and lines[-1].strip() == '```':
+        lines.pop()
+
+    # Remove everything before the first markdown header and clean artifacts
+    def documentation_lines():
+        found_first_header = False
         
-        # Skip phase announcements and log artifacts anywhere in the document
-        if (stripped_line.startswith("🔍 PHASE") or
-            stripped_line.startswith("🏗️ PHASE") or
-            stripped_line.startswith("📈 PHASE") or
-            stripped_line.startswith("✨ QUALITY") or
-            stripped_line.startswith("Based on") or
-            stripped_line.startswith("Let me") or
-            stripped_line.startswith("I'll") or
-            "information we've gathered" in stripped_line.lower()):
-            continue
+        for line in lines:
+            stripped_line = line.strip()
+            
+            # Look for the first markdown header to start the real documentation
+            if not found_first_header:
+                if stripped_line.startswith('#'):
+                    found_first_header = True
+                else:
+                    continue  # Skip everything before the first header
             
-        # Skip empty lines at the beginning only
-        if not cleaned_lines and not stripped_line:
-            continue
+            # Skip phase announcements and log artifacts anywhere in the document
+            if (stripped_line.startswith(RESPONSE_ARTIFACT_PREFIXES) or
+                "information we've gathered" in stripped_line.lower()):
+                continue
             
-        cleaned_lines.append(line)
+            yield line
     
-    final_result = '\n'.join(cleaned_lines).strip()
+    # Stream the kept lines straight into join; the final strip drops any leading blank lines
+    final_result = '\n'.join(documentation_lines()).strip()
     
     logger.info("🪞 Magic Mirror: Analysis complete, documentation generated")
     return final_result
@@ -529,25 +541,8 @@ def create_focused_mirror(analysis_type: str = "getting_started") -> Agent:
     
     config = PROMPT_TOOL_MAPPING[analysis_type]
     
-    # Map tool names to actual tool functions
-    tool_map = {
-        'execution_time_status': execution_time_status,
-        'quick_time_check': quick_time_check,
-        'git_repo_stats': git_repo_stats,
-        'git_files': git_files,
-        'git_recent_files': git_recent_files,
-        'git_log': git_log,
-        'git_contributors': git_contributors,
-        'git_branch_info': git_branch_info,
-        'find_key_files': find_key_files,
-        'file_read': file_read,
-        'list_directory': list_directory,
-        'peek_file': peek_file,
-        'explore_project_structure': explore_project_structure
-    }
-    
     # Get the required tools for this analysis type
-    required_tools = [tool_map[tool_name] for tool_name in config['tools'] if tool_name in tool_map]
+    required_tools = [TOOL_MAP[tool_name] for tool_name in config['tools'] if tool_name in TOOL_MAP]
     
     # Get agent configuration from config file
     agent_config = get_agent_config()
@@ -711,7 +706,6 @@ def lambda_handler(event, context):
 if __name__ == "__main__":
     import sys
     import argparse
-    from pathlib import Path
     
     parser = argparse.ArgumentParser(description="Magic Mirror - Intelligent Code Documentation Generator")
     parser.add_argument("repo_path", help="Path to the repository to analyze")
@@ -1,6 +1,7 @@
 import json
 import boto3
 import os
+import re
 import zipfile
 import tempfile
 import logging
@@ -20,6 +21,108 @@ DRAWER_BUCKET = os.environ.get('DRAWER_BUCKET', 'coderipple-drawer')
 SHOWROOM_BUCKET = os.environ.get('SHOWROOM_BUCKET', 'coderipple-showroom')
 EVENT_BUS_NAME = os.environ.get('EVENT_BUS_NAME', 'coderipple-events')
 
+# Base template from shared-assets/templates/base-index.html
+# This template is designed to automatically render README.md with Docsify
+ANALYSIS_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>{{SITE_TITLE}}</title>
+  <meta http-equiv="X-UA-Compatible" content="IE=edge,chrome=1" />
+  <meta name="description" content="{{SITE_DESCRIPTION}}">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0">
+  <link rel="stylesheet" href="//cdn.jsdelivr.net/npm/docsify@4/lib/themes/vue.css">
+  <link rel="stylesheet" href="../../../assets/css/coderipple.css">
+  <link rel="icon" type="image/png" href="../../../assets/images/coderipple-logo.png">
+</head>
+<body>
+  <div id="app">
+    <div style="text-align: center; padding: 50px; color: #021A2D;">
+      <h2>Loading {{SITE_NAME}}...</h2>
+      <p>{{LOADING_MESSAGE}}</p>
+    </div>
+  </div>
+  <script>
+    window.$docsify = {
+      name: '{{SITE_NAME}}',
+      repo: '',
+      loadSidebar: {{LOAD_SIDEBAR}},
+      loadNavbar: false,
+      maxLevel: 4,
+      subMaxLevel: 3,
+      auto2top: true,
+      search: {
+        maxAge: 86400000,
+        paths: 'auto',
+        placeholder: '{{SEARCH_PLACEHOLDER}}',
+        noData: 'No results found.',
+        depth: 3
+      },
+      plugins: [
+        function(hook, vm) {
+          hook.mounted(function() {
+            // Create custom header with logo
+            const header = document.createElement('div');
+            header.className = 'app-name';
+            // Analysis pages need different navigation
+            var headerHref = window.location.pathname.includes('/analyses/') ? '../../../' : '#/';
+            var logoSrc = window.location.pathname.includes('/analyses/') ? '../../../assets/images/coderipple-logo.png' : 'assets/images/coderipple-logo.png';
+            
+            header.innerHTML = '<a href="' + headerHref + '" class="app-name-link">' +
+              '<img src="' + logoSrc + '" alt="CodeRipple">' +
+              '<div class="app-name-text">' +
+                '<div class="app-name-title">{{HEADER_TITLE}}</div>' +
+                '<div class="app-name-tagline">{{HEADER_TAGLINE}}</div>' +
+              '</div>' +
+            '</a>';
+            document.body.insertBefore(header, document.body.firstChild);
+            
+            // Add download button for analysis pages
+            if (window.location.pathname.includes('/analyses/')) {
+              const downloadBtn = document.createElement('div');
+              downloadBtn.style.cssText = 'position: fixed; top: 100px; right: 20px; z-index: 1000;';
+              downloadBtn.innerHTML = '<a href="./analysis.zip" class="coderipple-btn" style="background-color: #1EA3B7; color: white; padding: 10px 15px; text-decoration: none; border-radius: 4px;">Download Results</a>';
+              document.body.appendChild(downloadBtn);
+            }
+            
+            // Create fixed footer at bottom (only for non-analysis pages)
+            if (!window.location.pathname.includes('/analyses/')) {
+              const footer = document.createElement('div');
+              footer.className = 'footer-content';
+              footer.innerHTML = '<p style="font-size: 1.1em; margin-bottom: 8px;"><strong>{{FOOTER_TITLE}}</strong></p>' +
+                '<p style="font-family: \\'JetBrains Mono\\', monospace; font-size: 0.9em; opacity: 0.8; margin-bottom: 12px;">{{FOOTER_TAGLINE}}</p>' +
+                '<p style="font-size: 0.8em; opacity: 0.7;"><em>Generated: ' + new Date().toLocaleString() + '</em></p>';
+              document.body.appendChild(footer);
+            }
+          });
+          
+          hook.doneEach(function() {
+            // Add click tracking for analysis links
+            const analysisLinks = document.querySelectorAll('a[href*="/analyses/"]');
+            analysisLinks.forEach(link => {
+              link.addEventListener('click', function(e) {
+                console.log('CodeRipple analysis access:', this.href);
+              });
+            });
+          });
+        }
+      ]
+    }
+  </script>
+  <!-- Docsify v4 -->
+  <script src="//cdn.jsdelivr.net/npm/docsify@4"></script>
+  <!-- Search plugin -->
+  <script src="//cdn.jsdelivr.net/npm/docsify/lib/plugins/search.min.js"></script>
+  <!-- Copy code plugin -->
+  <script src="//cdn.jsdelivr.net/npm/docsify-copy-code/dist/docsify-copy-code.min.js"></script>
+  <!-- Zoom image plugin -->
+  <script src="//cdn.jsdelivr.net/npm/docsify/lib/plugins/zoom-image.min.js"></script>
+</body>
+</html>"""
+
+# Matches {{VARIABLE}} placeholders in ANALYSIS_PAGE_TEMPLATE
+TEMPLATE_VARIABLE_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
 def lambda_handler(event, context):
     """
     Deliverer Lambda - Packages analysis results and delivers to Showroom
@@ -33,8 +136,9 @@ def lambda_handler(event, context):
     try:
         # Parse EventBridge event
         detail = event.get('detail', {})
-        repo_owner = detail.get('repository', {}).get('owner')
-        repo_name = detail.get('repository', {}).get('name')
+        repository = detail.get('repository', {})
+        repo_owner = repository.get('owner')
+        repo_name = repository.get('name')
         commit_sha = detail.get('commit_sha')
         
         if not all([repo_owner, repo_name, commit_sha]):
@@ -156,12 +260,9 @@ def package_analysis_results(repo_owner: str, repo_name: str, commit_sha: str, a
             package_readme = generate_package_readme(repo_owner, repo_name, commit_sha)
             zipf.writestr("README.md", package_readme)
             
-            # Add analysis files
+            # Add analysis files (writestr accepts both str and bytes content as is)
             for filename, content in analysis_data.items():
-                if isinstance(content, str):
-                    zipf.writestr(f"analysis/{filename}", content)
-                else:
-                    zipf.writestr(f"analysis/{filename}", content)
+                zipf.writestr(f"analysis/{filename}", content)
             
             # Add metadata
             metadata = {
@@ -248,16 +349,17 @@ def upload_to_showroom(repo_owner: str, repo_name: str, commit_sha: str, package
         )
         
         # Upload individual analysis files for web viewing
-        for filename, content in analysis_data.items():
-            if filename.endswith('.md'):
-                # Use README.md for main analysis content for Docsify rendering
-                output_filename = 'README.md' if 'README.md' in filename or len([f for f in analysis_data.keys() if f.endswith('.md')]) == 1 else filename
-                s3_client.put_object(
-                    Bucket=SHOWROOM_BUCKET,
-                    Key=f"{showroom_prefix}/{output_filename}",
-                    Body=content if isinstance(content, str) else content.decode('utf-8'),
-                    ContentType='text/markdown',
-                    )
+        markdown_files = [(filename, content) for filename, content in analysis_data.items() if filename.endswith('.md')]
+        single_markdown = len(markdown_files) == 1
+        for filename, content in markdown_files:
+            # Use README.md for main analysis content for Docsify rendering
+            output_filename = 'README.md' if 'README.md' in filename or single_markdown else filename
+            s3_client.put_object(
+                Bucket=SHOWROOM_BUCKET,
+                Key=f"{showroom_prefix}/{output_filename}",
+                Body=content if isinstance(content, str) else content.decode('utf-8'),
+                ContentType='text/markdown',
+                )
         
         analysis_url = f"http://{SHOWROOM_BUCKET}.s3-website-us-east-1.amazonaws.com/analyses/{repo_owner}/{repo_name}/{commit_sha}/"
         
@@ -273,105 +375,6 @@ def generate_analysis_page(repo_owner: str, repo_name: str, commit_sha: str, ana
     Generate HTML page for analysis results using shared template system
     """
     
-    # Base template from shared-assets/templates/base-index.html
-    # This template is designed to automatically render README.md with Docsify
-    template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <title>{{SITE_TITLE}}</title>
-  <meta http-equiv="X-UA-Compatible" content="IE=edge,chrome=1" />
-  <meta name="description" content="{{SITE_DESCRIPTION}}">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0">
-  <link rel="stylesheet" href="//cdn.jsdelivr.net/npm/docsify@4/lib/themes/vue.css">
-  <link rel="stylesheet" href="../../../assets/css/coderipple.css">
-  <link rel="icon" type="image/png" href="../../../assets/images/coderipple-logo.png">
-</head>
-<body>
-  <div id="app">
-    <div style="text-align: center; padding: 50px; color: #021A2D;">
-      <h2>Loading {{SITE_NAME}}...</h2>
-      <p>{{LOADING_MESSAGE}}</p>
-    </div>
-  </div>
-  <script>
-    window.$docsify = {
-      name: '{{SITE_NAME}}',
-      repo: '',
-      loadSidebar: {{LOAD_SIDEBAR}},
-      loadNavbar: false,
-      maxLevel: 4,
-      subMaxLevel: 3,
-      auto2top: true,
-      search: {
-        maxAge: 86400000,
-        paths: 'auto',
-        placeholder: '{{SEARCH_PLACEHOLDER}}',
-        noData: 'No results found.',
-        depth: 3
-      },
-      plugins: [
-        function(hook, vm) {
-          hook.mounted(function() {
-            // Create custom header with logo
-            const header = document.createElement('div');
-            header.className = 'app-name';
-            // Analysis pages need different navigation
-            var headerHref = window.location.pathname.includes('/analyses/') ? '../../../' : '#/';
-            var logoSrc = window.location.pathname.includes('/analyses/') ? '../../../assets/images/coderipple-logo.png' : 'assets/images/coderipple-logo.png';
-            
-            header.innerHTML = '<a href="' + headerHref + '" class="app-name-link">' +
-              '<img src="' + logoSrc + '" alt="CodeRipple">' +
-              '<div class="app-name-text">' +
-                '<div class="app-name-title">{{HEADER_TITLE}}</div>' +
-                '<div class="app-name-tagline">{{HEADER_TAGLINE}}</div>' +
-              '</div>' +
-            '</a>';
-            document.body.insertBefore(header, document.body.firstChild);
-            
-            // Add download button for analysis pages
-            if (window.location.pathname.includes('/analyses/')) {
-              const downloadBtn = document.createElement('div');
-              downloadBtn.style.cssText = 'position: fixed; top: 100px; right: 20px; z-index: 1000;';
-              downloadBtn.innerHTML = '<a href="./analysis.zip" class="coderipple-btn" style="background-color: #1EA3B7; color: white; padding: 10px 15px; text-decoration: none; border-radius: 4px;">Download Results</a>';
-              document.body.appendChild(downloadBtn);
-            }
-            
-            // Create fixed footer at bottom (only for non-analysis pages)
-            if (!window.location.pathname.includes('/analyses/')) {
-              const footer = document.createElement('div');
-              footer.className = 'footer-content';
-              footer.innerHTML = '<p style="font-size: 1.1em; margin-bottom: 8px;"><strong>{{FOOTER_TITLE}}</strong></p>' +
-                '<p style="font-family: \\'JetBrains Mono\\', monospace; font-size: 0.9em; opacity: 0.8; margin-bottom: 12px;">{{FOOTER_TAGLINE}}</p>' +
-                '<p style="font-size: 0.8em; opacity: 0.7;"><em>Generated: ' + new Date().toLocaleString() + '</em></p>';
-              document.body.appendChild(footer);
-            }
-          });
-          
-          hook.doneEach(function() {
-            // Add click tracking for analysis links
-            const analysisLinks = document.querySelectorAll('a[href*="/analyses/"]');
-            analysisLinks.forEach(link => {
-              link.addEventListener('click', function(e) {
-                console.log('CodeRipple analysis access:', this.href);
-              });
-            });
-          });
-        }
-      ]
-    }
-  </script>
-  <!-- Docsify v4 -->
-  <script src="//cdn.jsdelivr.net/npm/docsify@4"></script>
-  <!-- Search plugin -->
-  <script src="//cdn.jsdelivr.net/npm/docsify/lib/plugins/search.min.js"></script>
-  <!-- Copy code plugin -->
-  <script src="//cdn.jsdelivr.net/npm/docsify-copy-code/dist/docsify-copy-code.min.js"></script>
-  <!-- Zoom image plugin -->
-  <script src="//cdn.jsdelivr.net/npm/docsify/lib/plugins/zoom-image.min.js"></script>
-</body>
-</html>"""
-    
     # Analysis-specific template variables
     template_vars = {
         "SITE_NAME": "CodeRipple Analysis",
@@ -386,13 +389,19 @@ def generate_analysis_page(repo_owner: str, repo_name: str, commit_sha: str, ana
         "FOOTER_TAGLINE": "documentation that evolves with your code, automatically",
     }
     
-    # Replace template variables
-    html = template
-    for key, value in template_vars.items():
-        html = html.replace(f"{{{{{key}}}}}", value)
+    # Replace template variables in a single pass over the template
+    html = TEMPLATE_VARIABLE_PATTERN.sub(
+        lambda match: template_vars.get(match.group(1), match.group(0)),
+        ANALYSIS_PAGE_TEMPLATE
+    )
     
     return html
 
+def _line_end(text: str, start: int) -> int:
+    """Return the index of the newline ending the line at start (or len(text))"""
+    end = text.find('\n', start)
+    return len(text) if end == -1 else end
+
 def update_showroom_website(repo_owner: str, repo_name: str, commit_sha: str, analysis_url: str):
     """
     Update Showroom README.md with new analysis entry (prepend method)
@@ -420,27 +429,28 @@ def update_showroom_website(repo_owner: str, repo_name: str, commit_sha: str, an
 </div>
 """
         
-        # Find "Recent Analyses" section and prepend new entry
-        lines = current_readme.split('\n')
-        header_index = -1
-        
-        for i, line in enumerate(lines):
-            if line.strip() == '# Recent Analyses':
-                header_index = i
+        # Find "Recent Analyses" header line without splitting the whole README
+        search_from = 0
+        while True:
+            header_start = current_readme.find('# Recent Analyses', search_from)
+            if header_start == -1:
+                raise ValueError("Could not find 'Recent Analyses' section in README.md")
+            line_start = current_readme.rfind('\n', 0, header_start) + 1
+            line_end = _line_end(current_readme, header_start)
+            if current_readme[line_start:line_end].strip() == '# Recent Analyses':
                 break
-        
-        if header_index == -1:
-            raise ValueError("Could not find 'Recent Analyses' section in README.md")
+            search_from = line_end
         
         # Insert new entry after the header (and any empty line)
-        insert_index = header_index + 1
-        if insert_index < len(lines) and lines[insert_index].strip() == '':
-            insert_index += 1
-        
-        lines.insert(insert_index, new_entry)
+        insert_at = line_end + 1
+        if insert_at <= len(current_readme) and not current_readme[insert_at:_line_end(current_readme, insert_at)].strip():
+            insert_at = _line_end(current_readme, insert_at) + 1
         
         # Upload updated README.md
-        updated_readme = '\n'.join(lines)
+        if insert_at > len(current_readme):
+            updated_readme = current_readme + '\n' + new_entry
+        else:
+            updated_readme = current_readme[:insert_at] + new_entry + '\n' + current_readme[insert_at:]
         s3_client.put_object(
             Bucket=SHOWROOM_BUCKET,
             Key='README.md',
@@ -14,6 +14,12 @@ s3_client = boto3.client('s3')
 # Environment variables
 INVENTORY_BUCKET = os.environ.get('INVENTORY_BUCKET', 'coderipple-cabinet')
 
+# Event-specific detail formatters: (repo_name, detail) -> details column
+EVENT_DETAIL_FORMATTERS = {
+    'analysis_complete': lambda repo_name, detail: f"{repo_name} ({len(detail.get('s3_files', []))} files)",
+    'pr_created': lambda repo_name, detail: f"{repo_name}#{detail.get('pr_number', 'unknown')}"
+}
+
 def lambda_handler(event, context):
     """
     Hermes - The Bureaucrat
@@ -79,16 +85,9 @@ def extract_event_details(event_type, detail):
     repository = detail.get('repository', {})
     repo_name = f"{repository.get('owner', 'unknown')}/{repository.get('name', 'unknown')}"
     
-    if event_type == 'repo_ready':
-        return f"{repo_name}"
-    elif event_type == 'analysis_complete':
-        files = detail.get('s3_files', [])
-        return f"{repo_name} ({len(files)} files)"
-    elif event_type == 'pr_created':
-        pr_number = detail.get('pr_number', 'unknown')
-        return f"{repo_name}#{pr_number}"
-    else:
-        return f"{repo_name}"
+    # Event types without a formatter (e.g. repo_ready) log just the repository
+    formatter = EVENT_DETAIL_FORMATTERS.get(event_type)
+    return formatter(repo_name, detail) if formatter else repo_name
 
 def create_error_log(event, error_message):
     """
@@ -119,7 +118,8 @@ def clean_table_empty_lines(content):
             cleaned_lines.append(line)
         elif in_table and header_separator_found:
             # We're in the table data section
-            if line.strip() == '' or line.strip() == '|':
+            stripped_line = line.strip()
+            if stripped_line in ('', '|'):
                 # Skip empty lines in table completely
                 continue
             elif line.startswith('|') and line.endswith('|'):
@@ -153,9 +153,9 @@ def write_to_inventory(log_entry):
             return
         
         # Parse log entry and format as table row
-        parts = log_entry.split(' | ')
-        if len(parts) >= 4:
-            timestamp, component, event, details = parts[0], parts[1], parts[2], ' | '.join(parts[3:])
+        parts = log_entry.split(' | ', 3)
+        if len(parts) == 4:
+            timestamp, component, event, details = parts
             table_row = f"| {timestamp} | {component} | {event} | {details} |"
         else:
             # Fallback for malformed entries
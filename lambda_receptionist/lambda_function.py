@@ -17,6 +17,10 @@ eventbridge_client = boto3.client('events')
 DRAWER_BUCKET = 'coderipple-drawer'
 GITHUB_SECRET = os.environ.get('GITHUB_WEBHOOK_SECRET', '')
 
+# Webhook filters
+PROCESSED_BRANCH_REFS = frozenset({'refs/heads/main', 'refs/heads/master'})
+PROCESSED_PR_ACTIONS = frozenset({'opened', 'synchronize', 'reopened'})
+
 def lambda_handler(event, context):
     """
     Receptionist Lambda - Processes GitHub webhook events
@@ -50,7 +54,7 @@ def lambda_handler(event, context):
         }
         
         # Process webhook asynchronously
-        process_webhook(event, task_id)
+        process_webhook(event, body, task_id)
         
         return response
         
@@ -76,25 +80,26 @@ def lambda_handler(event, context):
             'body': json.dumps({'message': 'Webhook received'})
         }
 
-def process_webhook(event, task_id):
-    """Process GitHub webhook event with filtering and validation"""
+def process_webhook(event, body, task_id):
+    """Process GitHub webhook event with filtering and validation
+    
+    body is the webhook payload already parsed by lambda_handler.
+    """
+    
+    webhook_event = event.get('headers', {}).get('X-GitHub-Event', '')
+    repository = body.get('repository', {})
     
     try:
         # Validate webhook signature
         if not validate_github_signature(event):
             raise ValueError("Invalid GitHub webhook signature")
         
-        # Parse webhook payload
-        body = json.loads(event.get('body', '{}'))
-        webhook_event = event.get('headers', {}).get('X-GitHub-Event', '')
-        
         print(f"Processing GitHub event: {webhook_event}")
         
         # Filter GitHub events - only process push and pull_request events
         if not should_process_event(webhook_event, body):
             print(f"Skipping event type: {webhook_event}")
             # Send task_completed for filtered events
-            repository = body.get('repository', {})
             send_task_event('task_completed', task_id, {
                 'repository': {
                     'owner': repository.get('owner', {}).get('login', 'unknown'),
@@ -106,7 +111,6 @@ def process_webhook(event, task_id):
             return
         
         # Extract repository information
-        repository = body.get('repository', {})
         repo_owner = repository.get('owner', {}).get('login')
         repo_name = repository.get('name')
         default_branch = repository.get('default_branch', 'main')
@@ -125,20 +129,24 @@ def process_webhook(event, task_id):
         # Upload to Drawer S3 bucket
         s3_location = upload_to_drawer(repo_owner, repo_name, commit_sha, workingcopy_path, repohistory_path)
         
-        # Send repo_ready event to EventBridge
-        send_repo_ready_event(repo_owner, repo_name, default_branch, commit_sha, s3_location)
-        
-        # Send task_completed event
-        send_task_event('task_completed', task_id, {
-            'repository': {
-                'owner': repo_owner,
-                'name': repo_name,
-                'commit_sha': commit_sha
-            },
-            's3_location': s3_location,
-            'webhook_event': webhook_event,
-            'message': 'Repository successfully processed and stored in S3'
-        })
+        # Send repo_ready event and task_completed event to EventBridge in one call
+        eventbridge_client.put_events(
+            Entries=[
+                build_repo_ready_entry(repo_owner, repo_name, default_branch, commit_sha, s3_location),
+                build_task_event_entry('task_completed', task_id, {
+                    'repository': {
+                        'owner': repo_owner,
+                        'name': repo_name,
+                        'commit_sha': commit_sha
+                    },
+                    's3_location': s3_location,
+                    'webhook_event': webhook_event,
+                    'message': 'Repository successfully processed and stored in S3'
+                })
+            ]
+        )
+        
+        print(f"Sent repo_ready and task_completed events for task {task_id}")
         
         print(f"Successfully processed repository: {repo_owner}/{repo_name}")
         
@@ -146,20 +154,13 @@ def process_webhook(event, task_id):
         print(f"Error in process_webhook: {str(e)}")
         print(f"Traceback: {traceback.format_exc()}")
         
-        # Extract repository info for error logging
-        try:
-            body = json.loads(event.get('body', '{}'))
-            repository = body.get('repository', {})
-            repo_owner = repository.get('owner', {}).get('login', 'unknown')
-            repo_name = repository.get('name', 'unknown')
-            webhook_event = event.get('headers', {}).get('X-GitHub-Event', 'unknown')
-        except:
-            repo_owner = repo_name = webhook_event = 'unknown'
-        
-        # Send task_failed event
+        # Send task_failed event using the already parsed repository info
         send_task_event('task_failed', task_id, {
-            'repository': {'owner': repo_owner, 'name': repo_name},
-            'webhook_event': webhook_event,
+            'repository': {
+                'owner': repository.get('owner', {}).get('login', 'unknown'),
+                'name': repository.get('name', 'unknown')
+            },
+            'webhook_event': webhook_event or 'unknown',
             'error': {
                 'type': type(e).__name__,
                 'message': str(e),
@@ -178,12 +179,12 @@ def should_process_event(webhook_event, body):
     if webhook_event == 'push':
         ref = body.get('ref', '')
         # Only process pushes to main/master branches
-        return ref in ['refs/heads/main', 'refs/heads/master']
+        return ref in PROCESSED_BRANCH_REFS
     
     # Process pull request events (opened, synchronize, reopened)
     if webhook_event == 'pull_request':
         action = body.get('action', '')
-        return action in ['opened', 'synchronize', 'reopened']
+        return action in PROCESSED_PR_ACTIONS
     
     # Skip all other events
     return False
@@ -234,7 +235,6 @@ def clone_repository(repo_owner, repo_name, commit_sha):
     with tempfile.TemporaryDirectory() as temp_dir:
         repo_full_path = os.path.join(temp_dir, 'repo_full')
         workingcopy_path = os.path.join(temp_dir, 'workingcopy')
-        repohistory_path = os.path.join(temp_dir, 'repohistory')
         
         print(f"Cloning repository: {repo_url}")
         
@@ -256,10 +256,11 @@ def clone_repository(repo_owner, repo_name, commit_sha):
         
         # Step 3: Create clean working copy (no .git)
         os.makedirs(workingcopy_path)
-        subprocess.run([
-            'git', 'archive', commit_sha,
-            '--format=tar'
-        ], cwd=repo_full_path, stdout=open(os.path.join(temp_dir, 'workingcopy.tar'), 'wb'), check=True)
+        with open(os.path.join(temp_dir, 'workingcopy.tar'), 'wb') as tar_file:
+            subprocess.run([
+                'git', 'archive', commit_sha,
+                '--format=tar'
+            ], cwd=repo_full_path, stdout=tar_file, check=True)
         
         # Extract working copy
         subprocess.run([
@@ -267,17 +268,13 @@ def clone_repository(repo_owner, repo_name, commit_sha):
             '-C', workingcopy_path
         ], check=True)
         
-        # Copy full repository for history
-        subprocess.run([
-            'cp', '-r', repo_full_path, repohistory_path
-        ], check=True)
-        
         # Create ZIP files for upload
         workingcopy_zip = os.path.join(temp_dir, 'workingcopy.zip')
         repohistory_zip = os.path.join(temp_dir, 'repohistory.zip')
         
         create_zip_archive(workingcopy_path, workingcopy_zip)
-        create_zip_archive(repohistory_path, repohistory_zip)
+        # The full clone already is the repository history - archive it in place
+        create_zip_archive(repo_full_path, repohistory_zip)
         
         return workingcopy_zip, repohistory_zip
 
@@ -310,8 +307,8 @@ def upload_to_drawer(repo_owner, repo_name, commit_sha, workingcopy_path, repohi
     
     return s3_prefix
 
-def send_task_event(event_type, task_id, details):
-    """Send task logging events following Component Task Logging Standard"""
+def build_task_event_entry(event_type, task_id, details):
+    """Build task logging event entry following Component Task Logging Standard"""
     
     event_detail = {
         'task_id': task_id,
@@ -321,18 +318,23 @@ def send_task_event(event_type, task_id, details):
         **details
     }
     
+    return {
+        'Source': 'coderipple.receptionist',
+        'DetailType': event_type,
+        'Detail': json.dumps(event_detail)
+    }
+
+def send_task_event(event_type, task_id, details):
+    """Send task logging events following Component Task Logging Standard"""
+    
     eventbridge_client.put_events(
-        Entries=[{
-            'Source': 'coderipple.receptionist',
-            'DetailType': event_type,
-            'Detail': json.dumps(event_detail)
-        }]
+        Entries=[build_task_event_entry(event_type, task_id, details)]
     )
     
     print(f"Sent {event_type} event for task {task_id}")
 
-def send_repo_ready_event(repo_owner, repo_name, default_branch, commit_sha, s3_location):
-    """Send repo_ready event to EventBridge"""
+def build_repo_ready_entry(repo_owner, repo_name, default_branch, commit_sha, s3_location):
+    """Build repo_ready event entry for EventBridge"""
     
     event_detail = {
         'component': 'Receptionist',
@@ -346,14 +348,8 @@ def send_repo_ready_event(repo_owner, repo_name, default_branch, commit_sha, s3_
         'timestamp': datetime.utcnow().isoformat() + 'Z'
     }
     
-    eventbridge_client.put_events(
-        Entries=[{
-            'Source': 'coderipple.system',
-            'DetailType': 'repo_ready',
-            'Detail': json.dumps(event_detail)
-        }]
-    )
-    
-    print(f"Sent repo_ready event for {repo_owner}/{repo_name}")
-
-
+    return {
+        'Source': 'coderipple.system',
+        'DetailType': 'repo_ready',
+        'Detail': json.dumps(event_detail)
+    }